@@ -16,7 +16,7 @@ def main():
     Use the tabs below to explore the functionalities and analyze the EEG data for research or clinical purposes.
     """)
 
-    tabs = st.tabs(["⚡ EEG Visualization", "📡 Frequency Analysis", "📊 Entropy Analysis"])
+    tabs = st.tabs(["⚡ EEG Visualization", "📡 Frequency Analysis", "📊 Entropy Analysis", "🎯 Event-Related Analysis", "🩺 Risk Scoring"])
 
     with tabs[0]:
         st.header("⚡ EEG Visualization")
@@ -54,6 +54,30 @@ def main():
         - 3️⃣ View the results in interactive line plots and bar charts.
         """)
 
+    with tabs[3]:
+        st.header("🎯 Event-Related Analysis")
+        st.markdown("""
+        This page analyzes EEG activity **around stimulus markers**, as used in auditory oddball, MMN and P300 paradigms.  
+        Epochs are cut around each event and averaged into **ERPs**, and **ERSP** maps show event-related changes in spectral power.
+
+        ### Instructions:
+        - 1️⃣ Select a CSV file; stimulus markers are read from a `Marker`/`Event` column, or set a fixed stimulus interval.
+        - 2️⃣ Choose the epoch window and, if available, the stimulus condition.
+        - 3️⃣ View the averaged ERP waveforms and the ERSP heatmap for a channel.
+        """)
+
+    with tabs[4]:
+        st.header("🩺 Risk Scoring")
+        st.markdown("""
+        This page scores recordings with a **trained classifier** stored in the `models` folder.  
+        Entropy and band-power features are computed for every window of every channel and scored in batches.
+
+        ### Instructions:
+        - 1️⃣ Select a pickled model (`.pkl`) and the recordings to score.
+        - 2️⃣ Choose the window size and whether to include entropy features.
+        - 3️⃣ View the per-channel and per-recording risk scores and the scoring throughput.
+        """)
+
 
 if __name__ == "__main__":
     main()
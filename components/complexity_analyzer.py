@@ -36,7 +36,7 @@ class ComplexityAnalyzer:
         complexity_info['Sample Entropy'] = samp_entropy
 
         # Compute Higuchi Fractal Dimension
-        higuchi_fd = nk.complexity_higuchi(self.signal)
+        higuchi_fd = nk.fractal_higuchi(self.signal)
         complexity_info['Higuchi FD'] = higuchi_fd
 
         # Compute Permutation Entropy
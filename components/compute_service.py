@@ -0,0 +1,209 @@
+# components/compute_service.py
+
+import os
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+
+class ComputeService:
+    """
+    In-process compute service shared by all Streamlit sessions.
+    Identical concurrent requests run only once (single-flight), requests are
+    dispatched round-robin across sessions to a bounded worker pool, and
+    recent results are kept in memory shared by every session.
+    Long jobs (e.g. surrogate tests) run on a separate lane so they never
+    occupy the workers that serve page loads.
+    """
+
+    MAX_WORKERS = max(1, min(4, os.cpu_count() or 1))
+    MAX_LONG_WORKERS = 2
+    # Completed results are cached up to this total size and count; larger results are never cached
+    MAX_CACHED_BYTES = 256 * 1024 ** 2
+    MAX_CACHED_RESULTS = 64
+    MAX_RESULT_BYTES = 64 * 1024 ** 2
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers=None, max_long_workers=None):
+        """
+        Create a service. Pages should use ComputeService.instance() instead.
+
+        :param max_workers: Number of worker threads for regular requests (default MAX_WORKERS)
+        :param max_long_workers: Number of worker threads for long jobs (default MAX_LONG_WORKERS)
+        """
+        self._lock = threading.Lock()
+        self._inflight = {}  # key -> Future shared by all requesters
+        self._results = OrderedDict()  # key -> (completed result, size in bytes), least recently used first
+        self._cached_bytes = 0
+
+        # Each lane has its own bounded pool and per-user round-robin queues
+        self._lanes = {}
+        for lane, workers in (("default", max_workers or self.MAX_WORKERS),
+                              ("long", max_long_workers or self.MAX_LONG_WORKERS)):
+            self._lanes[lane] = {
+                "max_workers": workers,
+                "executor": ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"compute-{lane}"),
+                "queues": OrderedDict(),  # user -> deque of pending tasks, in round-robin order
+                "running": 0
+            }
+
+    @classmethod
+    def instance(cls):
+        """
+        Return the process-wide service, creating it on first use.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @staticmethod
+    def current_user():
+        """
+        Identify the calling Streamlit session for fair scheduling.
+
+        :return: Session id, or "anonymous" outside a Streamlit script
+        """
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx is not None else "anonymous"
+
+    @staticmethod
+    def file_key(file_path):
+        """
+        Identify a file version for use in request keys.
+
+        :param file_path: Path to the file
+        :return: Tuple (absolute path, modification time)
+        """
+        return os.path.abspath(file_path), os.path.getmtime(file_path)
+
+    def submit(self, key, fn, *args, user=None, lane="default", **kwargs):
+        """
+        Submit a computation, joining an identical in-flight or cached request if any.
+
+        :param key: Hashable key identifying the computation and its inputs
+        :param fn: Callable to run
+        :param user: Requesting user (default: current Streamlit session)
+        :param lane: "default", or "long" for jobs that take minutes
+        :return: concurrent.futures.Future with the (shared, read-only) result
+        """
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                future = Future()
+                future.set_result(self._results[key][0])
+                return future
+
+            if key in self._inflight:
+                return self._inflight[key]
+
+            future = Future()
+            self._inflight[key] = future
+            user = user if user is not None else self.current_user()
+            self._lanes[lane]["queues"].setdefault(user, deque()).append((key, fn, args, kwargs, future))
+            self._dispatch(lane)
+            return future
+
+    def run(self, key, fn, *args, user=None, lane="default", **kwargs):
+        """
+        Submit a computation and wait for its result.
+
+        Exceptions raised by fn are re-raised in the caller.
+        """
+        return self.submit(key, fn, *args, user=user, lane=lane, **kwargs).result()
+
+    def _dispatch(self, lane):
+        """
+        Start queued tasks of a lane while its workers are free, taking one task per user in turn.
+        Must be called with the lock held.
+        """
+        state = self._lanes[lane]
+        while state["running"] < state["max_workers"] and state["queues"]:
+            user, queue = state["queues"].popitem(last=False)
+            task = queue.popleft()
+            if queue:
+                state["queues"][user] = queue
+
+            state["running"] += 1
+            state["executor"].submit(self._execute, lane, *task)
+
+    def _execute(self, lane, key, fn, args, kwargs, future):
+        """
+        Run one task in a worker thread and publish its result to every waiter.
+        """
+        try:
+            result = self._freeze(fn(*args, **kwargs))
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+                self._lanes[lane]["running"] -= 1
+                self._dispatch(lane)
+            future.set_exception(exc)
+            return
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            self._cache_result(key, result)
+            self._lanes[lane]["running"] -= 1
+            self._dispatch(lane)
+        future.set_result(result)
+
+    def _cache_result(self, key, result):
+        """
+        Keep a completed result, evicting least recently used ones to stay within
+        MAX_CACHED_BYTES and MAX_CACHED_RESULTS.
+        Must be called with the lock held.
+        """
+        size = self._nbytes(result)
+        if size > self.MAX_RESULT_BYTES:
+            return
+
+        self._results[key] = (result, size)
+        self._cached_bytes += size
+        while self._cached_bytes > self.MAX_CACHED_BYTES or len(self._results) > self.MAX_CACHED_RESULTS:
+            _, (_, evicted_size) = self._results.popitem(last=False)
+            self._cached_bytes -= evicted_size
+
+    @classmethod
+    def _nbytes(cls, result):
+        """
+        Approximate memory held by a result; objects other than arrays and DataFrames
+        count their shallow size.
+        """
+        if isinstance(result, np.ndarray):
+            return result.nbytes
+        if isinstance(result, pd.DataFrame):
+            return int(result.memory_usage(index=True, deep=False).sum())
+        if isinstance(result, (tuple, list)):
+            return sys.getsizeof(result) + sum(cls._nbytes(item) for item in result)
+        return sys.getsizeof(result)
+
+    @classmethod
+    def _freeze(cls, result):
+        """
+        Make a result read-only, since every session shares the same object.
+
+        DataFrames are rebuilt column by column on read-only views of their data,
+        so in-place writes raise instead of changing other sessions' data.
+        """
+        if isinstance(result, np.ndarray):
+            result.setflags(write=False)
+            return result
+        if isinstance(result, pd.DataFrame):
+            columns = {}
+            for col in result.columns:
+                values = result[col].to_numpy()
+                if isinstance(values, np.ndarray):
+                    values.setflags(write=False)
+                columns[col] = values
+            return pd.DataFrame(columns, index=result.index, copy=False)
+        if isinstance(result, (tuple, list)):
+            return type(result)(cls._freeze(item) for item in result)
+        return result
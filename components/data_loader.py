@@ -1,10 +1,13 @@
 # components/data_loader.py
 
 import os
+import numpy as np
 import pandas as pd
 import streamlit as st
 from scipy.signal import butter, filtfilt
 
+from components.compute_service import ComputeService
+
 
 class EEGDataLoader:
     """
@@ -15,6 +18,9 @@ class EEGDataLoader:
     # Channels most relevant in schizophrenia studies
     SCHIZO_CHANNELS = ["F3", "F4", "F7", "F8", "T3", "T4", "Cz", "Pz"]
 
+    # Columns that hold time stamps or stimulus markers rather than electrode signals
+    NON_EEG_COLUMNS = ["Time", "Marker", "Event", "Stim", "Trigger"]
+
     def __init__(self, file_name, sampling_rate=256):
         """
         Initialize the data loader.
@@ -30,10 +36,16 @@ class EEGDataLoader:
         """
         Loads EEG data from CSV.
 
+        The file is read through the shared ComputeService, so concurrent sessions
+        opening the same recording share one read and one read-only DataFrame;
+        use .copy() before modifying it.
+
         :return: pandas DataFrame containing EEG data or None if an error occurs.
         """
         try:
-            self.data = pd.read_csv(self.file_path, delimiter=",")
+            service = ComputeService.instance()
+            key = ("load_data", service.file_key(self.file_path))
+            self.data = service.run(key, pd.read_csv, self.file_path, delimiter=",")
             st.success(f"Successfully loaded {self.file_path}")
             return self.data
         except FileNotFoundError:
@@ -61,6 +73,38 @@ class EEGDataLoader:
             st.error("EEG data has not been loaded.")
             return []
 
+    def get_eeg_channels(self):
+        """
+        Returns all electrode channels in the data, not only the schizophrenia-relevant ones.
+
+        :return: List of numeric columns that are not time or marker columns.
+        """
+        if self.data is None:
+            st.error("EEG data has not been loaded.")
+            return []
+
+        numeric = self.data.select_dtypes(include="number").columns
+        return [ch for ch in numeric if ch not in self.NON_EEG_COLUMNS]
+
+    def get_channel_array(self, channels=None):
+        """
+        Returns the selected channels as a 2D (channels x samples) array.
+
+        The array is C-contiguous so that per-channel rows can be sliced and
+        strided without further copies.
+
+        :param channels: List of channel names (default: schizophrenia-relevant channels)
+        :return: numpy array of shape (n_channels, n_samples) or None if data is not loaded
+        """
+        if self.data is None:
+            st.error("EEG data has not been loaded.")
+            return None
+
+        if channels is None:
+            channels = self.get_channels()
+
+        return np.ascontiguousarray(self.data[channels].to_numpy(dtype=float).T)
+
     def bandpass_filter(self, low_freq=1, high_freq=50):
         """
         Apply a Butterworth bandpass filter to all schizophrenia-relevant channels.
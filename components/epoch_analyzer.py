@@ -0,0 +1,140 @@
+# components/epoch_analyzer.py
+
+import numpy as np
+import streamlit as st
+from numpy.lib.stride_tricks import as_strided, sliding_window_view
+
+from components.wavelet_analyzer import WaveletAnalyzer
+
+
+class EpochAnalyzer:
+    """
+    Event-locked analysis of EEG recordings for schizophrenia paradigms
+    (auditory oddball, MMN, P300).
+    Cuts epochs around stimulus markers and computes averaged ERPs and ERSP.
+    """
+
+    def __init__(self, data, events, sampling_rate=256, tmin=-0.2, tmax=0.8, labels=None):
+        """
+        Initialize with a multichannel recording and a list of stimulus events.
+
+        :param data: 2D array (channels x samples), e.g. from EEGDataLoader.get_channel_array
+        :param events: List of event onset times in seconds
+        :param sampling_rate: Sampling frequency in Hz (default 256 Hz)
+        :param tmin: Epoch start relative to the event in seconds (default -0.2 s)
+        :param tmax: Epoch end relative to the event in seconds (default 0.8 s)
+        :param labels: Optional list of condition labels, one per event (e.g. "standard", "deviant")
+        """
+        self.data = np.ascontiguousarray(data, dtype=float)
+        self.sampling_rate = sampling_rate
+        self.tmin = tmin
+        self.tmax = tmax
+
+        self.offset = int(round(tmin * sampling_rate))
+        self.n_samples = int(round(tmax * sampling_rate)) - self.offset
+        self.times = (np.arange(self.n_samples) + self.offset) / sampling_rate
+
+        onsets = np.round(np.asarray(events, dtype=float) * sampling_rate).astype(int) + self.offset
+        labels = np.asarray(labels) if labels is not None else np.full(len(onsets), None)
+
+        # Drop events whose epoch window falls outside the recording
+        valid = (onsets >= 0) & (onsets + self.n_samples <= self.data.shape[1])
+        if not np.all(valid):
+            st.warning(f"{np.count_nonzero(~valid)} event(s) too close to the recording edges were dropped.")
+
+        self.onsets = onsets[valid]
+        self.labels = labels[valid]
+
+    def get_epochs(self, label=None):
+        """
+        Build the (events x channels x samples) epoch tensor.
+
+        When the selected events are evenly spaced the tensor is a zero-copy
+        strided view over the recording; otherwise the epochs are gathered
+        from a sliding-window view in a single indexing operation.
+        The returned array must be treated as read-only.
+
+        :param label: Only return epochs of this condition (default: all events)
+        :return: numpy array of shape (n_events, n_channels, n_samples)
+        """
+        onsets = self.onsets if label is None else self.onsets[self.labels == label]
+        n_channels = self.data.shape[0]
+
+        if len(onsets) == 0:
+            return np.empty((0, n_channels, self.n_samples))
+
+        steps = np.diff(onsets)
+        if len(onsets) == 1 or (steps[0] > 0 and np.all(steps == steps[0])):
+            step = int(steps[0]) if len(steps) else 0
+            channel_stride, sample_stride = self.data.strides
+            start = self.data[:, onsets[0]:]
+            return as_strided(
+                start,
+                shape=(len(onsets), n_channels, self.n_samples),
+                strides=(step * sample_stride, channel_stride, sample_stride),
+                writeable=False
+            )
+
+        windows = sliding_window_view(self.data, self.n_samples, axis=1)
+        return windows[:, onsets, :].transpose(1, 0, 2)
+
+    def _baseline_mask(self):
+        """
+        Boolean mask of the pre-stimulus samples used for baseline correction.
+        """
+        return self.times < 0
+
+    def compute_erp(self, label=None, baseline=True):
+        """
+        Average epochs into an event-related potential.
+
+        :param label: Only average epochs of this condition (default: all events)
+        :param baseline: Subtract the mean pre-stimulus amplitude (default True)
+        :return: numpy array of shape (n_channels, n_samples)
+        """
+        epochs = self.get_epochs(label)
+        if len(epochs) == 0:
+            st.warning("No epochs available to average.")
+            return np.zeros((self.data.shape[0], self.n_samples))
+
+        erp = epochs.mean(axis=0)
+
+        # Averaging is linear, so baseline-correcting the average equals averaging corrected epochs
+        mask = self._baseline_mask()
+        if baseline and np.any(mask):
+            erp -= erp[:, mask].mean(axis=1, keepdims=True)
+
+        return erp
+
+    def compute_ersp(self, label=None, min_freq=0.5, max_freq=50, baseline=True, picks=None):
+        """
+        Compute event-related spectral perturbation with a single batched wavelet transform.
+
+        :param label: Only use epochs of this condition (default: all events)
+        :param min_freq: Minimum frequency of interest (default 0.5 Hz)
+        :param max_freq: Maximum frequency of interest (default 50 Hz)
+        :param baseline: Express power in dB relative to the pre-stimulus period (default True)
+        :param picks: Row indices of the channels to transform (default: all channels)
+        :return: ersp (n_picked_channels x n_freqs x n_samples), corresponding frequencies (1D array)
+        """
+        epochs = self.get_epochs(label)
+        if picks is not None:
+            # Select channels before the transform, its memory scales with the channel count
+            epochs = epochs[:, picks]
+
+        if len(epochs) == 0:
+            st.warning("No epochs available for ERSP.")
+            return np.empty((epochs.shape[1], 0, self.n_samples)), np.array([])
+
+        analyzer = WaveletAnalyzer(epochs, self.sampling_rate, min_freq, max_freq)
+        coefficients, frequencies = analyzer.perform_batch_transform()
+
+        # (freqs, events, channels, samples) -> trial-averaged (channels, freqs, samples)
+        power = np.mean(np.abs(coefficients) ** 2, axis=1).transpose(1, 0, 2)
+
+        mask = self._baseline_mask()
+        if baseline and np.any(mask):
+            baseline_power = power[:, :, mask].mean(axis=2, keepdims=True)
+            power = 10 * np.log10(power / (baseline_power + 1e-12) + 1e-12)
+
+        return power, frequencies
@@ -0,0 +1,84 @@
+# components/feature_extractor.py
+
+import numpy as np
+
+from components.entropy_analyzer import EntropyAnalyzer
+from components.wavelet_analyzer import WaveletAnalyzer
+
+
+class FeatureMatrixBuilder:
+    """
+    Builds a (windows x features) matrix from the entropy and wavelet analyzers,
+    ready to be fed to a classifier.
+    Each row is one non-overlapping window of one channel.
+    """
+
+    ENTROPY_FEATURES = ["Sample Entropy", "Approximate Entropy", "Permutation Entropy"]
+
+    # Windows per batched wavelet transform, bounds the memory of the CWT coefficients
+    WAVELET_BATCH = 32
+
+    def __init__(self, data, channels, sampling_rate=256, window_size_sec=5, include_entropy=True):
+        """
+        Initialize with a multichannel recording.
+
+        :param data: 2D array (channels x samples), e.g. from EEGDataLoader.get_channel_array
+        :param channels: Channel names matching the rows of data
+        :param sampling_rate: Sampling frequency in Hz (default 256 Hz)
+        :param window_size_sec: Window length in seconds (default 5 s)
+        :param include_entropy: Add entropy features (slower, computed per window)
+        """
+        self.data = np.ascontiguousarray(data, dtype=float)
+        self.channels = list(channels)
+        self.sampling_rate = sampling_rate
+        self.window_size = int(window_size_sec * sampling_rate)
+        self.include_entropy = include_entropy
+
+        self.feature_names = (self.ENTROPY_FEATURES if include_entropy else []) + \
+            [f"{band} Power" for band in WaveletAnalyzer.BANDS]
+
+    def get_windows(self):
+        """
+        Split every channel into non-overlapping windows without copying.
+
+        :return: numpy array view of shape (n_channels, n_windows, window_size)
+        """
+        num_windows = self.data.shape[1] // self.window_size
+        usable = self.data[:, :num_windows * self.window_size]
+        return usable.reshape(self.data.shape[0], num_windows, self.window_size)
+
+    def build(self):
+        """
+        Compute the feature matrix for all channels and windows.
+
+        :return: features (n_channels * n_windows x n_features, C-contiguous),
+                 row_channels (channel name per row), row_windows (window index per row)
+        """
+        windows = self.get_windows()
+        n_channels, num_windows, _ = windows.shape
+
+        features = np.empty((n_channels * num_windows, len(self.feature_names)))
+        n_entropy = len(self.ENTROPY_FEATURES) if self.include_entropy else 0
+
+        # Recording shorter than one window: nothing to compute
+        if num_windows == 0:
+            return features, np.array([], dtype=object), np.array([], dtype=int)
+
+        for i in range(n_channels):
+            rows = slice(i * num_windows, (i + 1) * num_windows)
+
+            if self.include_entropy:
+                analyzer = EntropyAnalyzer(self.data[i], self.sampling_rate)
+                entropy_windows = analyzer.calculate_entropy_windows(self.window_size / self.sampling_rate)
+                features[rows, :n_entropy] = [[w[name] for name in self.ENTROPY_FEATURES] for w in entropy_windows]
+
+            # Batched CWT over the windows of the channel, WAVELET_BATCH windows at a time
+            for start in range(0, num_windows, self.WAVELET_BATCH):
+                batch = windows[i, start:start + self.WAVELET_BATCH]
+                coefficients, frequencies = WaveletAnalyzer(batch, self.sampling_rate).perform_batch_transform()
+                band_rows = slice(rows.start + start, rows.start + start + len(batch))
+                features[band_rows, n_entropy:] = WaveletAnalyzer.extract_band_power_batch(coefficients, frequencies)
+
+        row_channels = np.repeat(self.channels, num_windows)
+        row_windows = np.tile(np.arange(num_windows), n_channels)
+        return features, row_channels, row_windows
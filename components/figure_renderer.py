@@ -0,0 +1,167 @@
+# components/figure_renderer.py
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import streamlit as st
+from matplotlib.figure import Figure
+
+
+class FigureRenderer:
+    """
+    Shared rendering layer for all dashboard plots.
+    Caches built figures keyed by a hash of their input data, shrinks the numeric
+    payload sent to the browser and manages matplotlib figure lifecycles explicitly.
+    """
+
+    # Process-wide cache shared by all Streamlit sessions (least recently used first)
+    MAX_CACHE_ENTRIES = 64
+    MAX_POINTS_PER_TRACE = 4000
+    MAX_HEATMAP_COLUMNS = 4000
+    SIGNIFICANT_DIGITS = 5
+
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def data_key(*arrays, **params):
+        """
+        Build a cache key from the raw bytes of the input arrays and plot parameters.
+
+        :param arrays: Array-like inputs of the figure
+        :param params: Scalar plot parameters (titles, ranges, channel names, ...)
+        :return: Hex digest identifying the figure
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for array in arrays:
+            array = np.ascontiguousarray(array)
+            hasher.update(f"{array.dtype}{array.shape}".encode())
+            hasher.update(array.reshape(-1).view(np.uint8))
+        hasher.update(repr(sorted(params.items())).encode())
+        return hasher.hexdigest()
+
+    @classmethod
+    def get_or_build(cls, key, build_fn):
+        """
+        Return the cached object for a key, building and storing it on a miss.
+
+        :param key: Cache key from data_key
+        :param build_fn: Zero-argument callable that builds the object
+        :return: Cached or freshly built object
+        """
+        with cls._lock:
+            if key in cls._cache:
+                cls._cache.move_to_end(key)
+                return cls._cache[key]
+
+        value = build_fn()
+
+        with cls._lock:
+            cls._cache[key] = value
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > cls.MAX_CACHE_ENTRIES:
+                cls._cache.popitem(last=False)
+        return value
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Drop all cached figures.
+        """
+        with cls._lock:
+            cls._cache.clear()
+
+    @classmethod
+    def compact_values(cls, values):
+        """
+        Round values to a fixed number of significant digits so they serialize
+        to short JSON numbers instead of full float64 representations.
+
+        :param values: Array-like of numbers
+        :return: Rounded float array
+        """
+        values = np.asarray(values, dtype=float)
+        finite = np.abs(values[np.isfinite(values)])
+        if finite.size == 0 or finite.max() == 0:
+            return values
+
+        decimals = max(0, cls.SIGNIFICANT_DIGITS - 1 - int(np.floor(np.log10(finite.max()))))
+        return np.round(values, decimals)
+
+    @classmethod
+    def compact_trace(cls, values):
+        """
+        Reduce a uniformly sampled line trace to at most MAX_POINTS_PER_TRACE points,
+        keeping the min/max envelope of each bucket so peaks stay visible.
+
+        :param values: 1D array of samples
+        :return: compacted values, number of original samples per returned point
+        """
+        values = np.asarray(values, dtype=float)
+        if len(values) <= cls.MAX_POINTS_PER_TRACE:
+            return cls.compact_values(values), 1
+
+        bucket = int(np.ceil(2 * len(values) / cls.MAX_POINTS_PER_TRACE))
+        padded = np.pad(values, (0, -len(values) % bucket), mode="edge")
+        blocks = padded.reshape(-1, bucket)
+
+        envelope = np.empty(2 * len(blocks))
+        envelope[0::2] = blocks.min(axis=1)
+        envelope[1::2] = blocks.max(axis=1)
+        return cls.compact_values(envelope), bucket / 2
+
+    @classmethod
+    def compact_grid(cls, values):
+        """
+        Reduce a heatmap to at most MAX_HEATMAP_COLUMNS columns by max-pooling over time.
+
+        :param values: 2D array (rows x samples)
+        :return: compacted values, number of original columns per returned column
+        """
+        values = np.asarray(values, dtype=float)
+        if values.shape[1] <= cls.MAX_HEATMAP_COLUMNS:
+            return cls.compact_values(values), 1
+
+        bucket = int(np.ceil(values.shape[1] / cls.MAX_HEATMAP_COLUMNS))
+        padded = np.pad(values, ((0, 0), (0, -values.shape[1] % bucket)), mode="edge")
+        pooled = padded.reshape(values.shape[0], -1, bucket).max(axis=2)
+        return cls.compact_values(pooled), bucket
+
+    @classmethod
+    def plotly_chart(cls, key, build_fn, **kwargs):
+        """
+        Display a Plotly figure, reusing the cached figure for identical inputs.
+
+        :param key: Cache key from data_key
+        :param build_fn: Zero-argument callable returning a plotly Figure
+        :param kwargs: Extra arguments for st.plotly_chart
+        """
+        fig = cls.get_or_build(key, build_fn)
+        st.plotly_chart(fig, **kwargs)
+
+    @classmethod
+    def pyplot(cls, key, draw_fn, figsize=(10, 4)):
+        """
+        Display a matplotlib figure as a cached PNG.
+
+        The figure is created outside pyplot's global registry and released
+        right after rendering, so repeated reruns do not accumulate figures.
+
+        :param key: Cache key from data_key
+        :param draw_fn: Callable receiving a matplotlib Axes to draw on
+        :param figsize: Figure size in inches
+        """
+        def render():
+            fig = Figure(figsize=figsize)
+            try:
+                draw_fn(fig.subplots())
+                buffer = io.BytesIO()
+                fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+                return buffer.getvalue()
+            finally:
+                fig.clear()
+
+        st.image(cls.get_or_build(key, render), use_column_width=True)
@@ -0,0 +1,202 @@
+# components/preprocessing.py
+
+import numpy as np
+from scipy.signal import butter, cheby1, iirnotch, sosfilt, sosfilt_zi, tf2sos
+
+from components.compute_service import ComputeService
+
+
+class PreprocessingPipeline:
+    """
+    Declarative EEG preprocessing: re-reference, notch, bandpass and decimation.
+    Stages are only recorded when declared; evaluation fuses them into a single
+    streaming pass over a (channels x samples) array, chunk by chunk.
+    """
+
+    # Samples per chunk, small enough for a chunk of all channels to stay in cache
+    CHUNK_SAMPLES = 8192
+
+    # Mastoid electrode names accepted for linked-mastoid referencing
+    MASTOID_CHANNELS = [("A1", "A2"), ("M1", "M2")]
+
+    def __init__(self, sampling_rate=256):
+        """
+        Create an empty pipeline.
+
+        :param sampling_rate: Sampling frequency of the input data in Hz (default 256 Hz)
+        """
+        self.sampling_rate = sampling_rate
+        self.reference = None
+        self.notch_filters = []
+        self.band = None
+        self.factor = 1
+
+    def rereference(self, mode="average"):
+        """
+        Re-reference to the common average ("average") or to linked mastoids ("mastoid").
+
+        :return: The pipeline, for chaining
+        """
+        if mode not in ("average", "mastoid"):
+            raise ValueError(f"Unknown reference '{mode}'. Use 'average' or 'mastoid'.")
+        self.reference = mode
+        return self
+
+    def notch(self, freq=50, quality=30):
+        """
+        Remove power-line interference (50 Hz in Europe/Chile, 60 Hz in the Americas).
+
+        :param freq: Line frequency in Hz (default 50 Hz)
+        :param quality: Quality factor of the notch (default 30)
+        :return: The pipeline, for chaining
+        """
+        self.notch_filters.append((freq, quality))
+        return self
+
+    def bandpass(self, low_freq=1, high_freq=50, order=5):
+        """
+        Butterworth bandpass filter.
+
+        :param low_freq: Low cutoff frequency in Hz
+        :param high_freq: High cutoff frequency in Hz
+        :param order: Filter order (default 5)
+        :return: The pipeline, for chaining
+        :raises ValueError: If the passband is empty or outside (0, Nyquist)
+        """
+        if not 0 < low_freq < high_freq < self.sampling_rate / 2:
+            raise ValueError(f"Bandpass needs 0 < low < high < {self.sampling_rate / 2} Hz "
+                             f"(got {low_freq}-{high_freq} Hz).")
+        self.band = (low_freq, high_freq, order)
+        return self
+
+    def decimate(self, factor):
+        """
+        Keep every factor-th sample, after anti-alias filtering.
+
+        :param factor: Integer decimation factor
+        :return: The pipeline, for chaining
+        """
+        self.factor = int(factor)
+        return self
+
+    @property
+    def output_rate(self):
+        """
+        Sampling frequency of the pipeline output in Hz.
+        """
+        return self.sampling_rate / self.factor
+
+    def is_identity(self):
+        """
+        True when no stage has been declared, i.e. the output equals the input.
+        """
+        return self.reference is None and not self.notch_filters and self.band is None and self.factor == 1
+
+    def config(self):
+        """
+        Hashable description of the pipeline, used as its cache key.
+        """
+        return (self.sampling_rate, self.reference, tuple(self.notch_filters), self.band, self.factor)
+
+    def _reference_matrix(self, channels):
+        """
+        Build the (output channels x input channels) re-referencing matrix.
+
+        :return: matrix (or None when no re-referencing is needed), output channel names
+        """
+        n = len(channels)
+        if self.reference == "average":
+            return np.eye(n) - 1.0 / n, list(channels)
+
+        if self.reference == "mastoid":
+            mastoids = next((pair for pair in self.MASTOID_CHANNELS if all(ch in channels for ch in pair)), None)
+            if mastoids is None:
+                raise ValueError("Linked-mastoid reference needs A1/A2 or M1/M2 channels in the data.")
+
+            keep = [i for i, ch in enumerate(channels) if ch not in mastoids]
+            matrix = np.eye(n)[keep]
+            for ch in mastoids:
+                matrix[:, channels.index(ch)] -= 0.5
+            return matrix, [channels[i] for i in keep]
+
+        return None, list(channels)
+
+    def _filter_sos(self):
+        """
+        Cascade all temporal filters (notch, bandpass, anti-alias) into one SOS array.
+        """
+        sections = []
+        for freq, quality in self.notch_filters:
+            b, a = iirnotch(freq, quality, fs=self.sampling_rate)
+            sections.append(tf2sos(b, a))
+
+        if self.band is not None:
+            low, high, order = self.band
+            sections.append(butter(order, [low, high], btype='band', fs=self.sampling_rate, output='sos'))
+
+        # Same anti-alias filter as scipy.signal.decimate; a bandpass edge alone does not attenuate enough
+        if self.factor > 1:
+            sections.append(cheby1(8, 0.05, 0.8 / self.factor, output='sos'))
+
+        return np.vstack(sections) if sections else None
+
+    def apply(self, data, channels):
+        """
+        Evaluate the pipeline in one streaming pass.
+
+        Filters are causal (sosfilt with state carried between chunks), since a
+        zero-phase filter would need a second, backward pass over the data.
+        Re-referencing and filtering are linear and commute, so stages always run
+        in the order re-reference, filters, decimation.
+
+        :param data: 2D array (channels x samples), e.g. from EEGDataLoader.get_channel_array
+        :param channels: Channel names matching the rows of data
+        :return: processed 2D array (output channels x output samples), output channel names
+        """
+        data = np.asarray(data, dtype=float)
+        matrix, out_channels = self._reference_matrix(list(channels))
+        sos = self._filter_sos()
+
+        n_samples = data.shape[1]
+        output = np.empty((len(out_channels), -(-n_samples // self.factor)))
+        if n_samples == 0:
+            return output, out_channels
+
+        zi = None
+        written = 0
+        for start in range(0, n_samples, self.CHUNK_SAMPLES):
+            chunk = data[:, start:start + self.CHUNK_SAMPLES]
+
+            if matrix is not None:
+                chunk = matrix @ chunk
+
+            if sos is not None:
+                if zi is None:
+                    # Start the filter in steady state for the first sample to avoid an onset transient
+                    zi = sosfilt_zi(sos)[:, np.newaxis, :] * chunk[np.newaxis, :, :1]
+                chunk, zi = sosfilt(sos, chunk, axis=-1, zi=zi)
+
+            # Keep the decimation phase aligned to the global sample index
+            kept = chunk[:, (-start) % self.factor::self.factor]
+            output[:, written:written + kept.shape[1]] = kept
+            written += kept.shape[1]
+
+        return output, out_channels
+
+    def run(self, loader, channels=None):
+        """
+        Evaluate the pipeline on a loaded recording through the shared ComputeService.
+        The output is cached per recording, channels and pipeline configuration, so
+        the channel array is only built and processed on a cache miss.
+
+        :param loader: EEGDataLoader with data loaded
+        :param channels: Channel names to process (default: all EEG channels, so the
+                         common average uses every electrode)
+        :return: processed 2D array (read-only, shared), output channel names
+        """
+        if channels is None:
+            channels = loader.get_eeg_channels()
+
+        service = ComputeService.instance()
+        key = ("preprocess", service.file_key(loader.file_path), tuple(channels), self.config())
+        return service.run(key, lambda: self.apply(loader.get_channel_array(channels), channels))
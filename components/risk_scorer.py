@@ -0,0 +1,117 @@
+# components/risk_scorer.py
+
+import os
+import pickle
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+
+class RiskScorer:
+    """
+    Scores EEG feature windows with a serialized classifier.
+    Any pickled model exposing predict_proba, decision_function or predict
+    (or a plain callable taking a 2D feature array) can be plugged in.
+    """
+
+    # Loaded models shared across sessions, keyed by (path, modification time)
+    _models = {}
+    _lock = threading.Lock()
+
+    def __init__(self, model_path, batch_size=4096):
+        """
+        Load the model (once per process and file version).
+
+        Pickle files can execute code when loaded; only use trusted models.
+
+        :param model_path: Path to a pickled model file
+        :param batch_size: Number of windows scored per model call (default 4096)
+        """
+        self.model_path = model_path
+        self.batch_size = batch_size
+        self.model = self._load_model(model_path)
+
+    @classmethod
+    def _load_model(cls, model_path):
+        """
+        Return the cached model for a file, unpickling it on first use.
+        """
+        key = (os.path.abspath(model_path), os.path.getmtime(model_path))
+        with cls._lock:
+            if key not in cls._models:
+                with open(model_path, "rb") as f:
+                    cls._models[key] = pickle.load(f)
+            return cls._models[key]
+
+    def check_features(self, n_features):
+        """
+        Check that the model was trained on this number of features.
+
+        Models without an n_features_in_ attribute are not checked.
+
+        :param n_features: Number of feature columns that will be scored
+        :raises ValueError: If the model expects a different number of features
+        """
+        expected = getattr(self.model, "n_features_in_", None)
+        if expected is not None and expected != n_features:
+            raise ValueError(f"The model expects {expected} features but {n_features} were computed. "
+                             "Check the entropy feature setting used to train the model.")
+
+    def _predict(self, batch):
+        """
+        Score one batch of feature rows with whichever interface the model offers.
+        """
+        if hasattr(self.model, "predict_proba"):
+            # Probability of the positive (last) class
+            return np.asarray(self.model.predict_proba(batch))[:, -1]
+        if hasattr(self.model, "decision_function"):
+            return np.asarray(self.model.decision_function(batch))
+        if hasattr(self.model, "predict"):
+            return np.asarray(self.model.predict(batch))
+        return np.asarray(self.model(batch))
+
+    def score(self, features):
+        """
+        Score all windows in batches.
+
+        Stats only cover the model calls; time feature building separately for end-to-end throughput.
+
+        :param features: 2D array (n_windows x n_features), e.g. from FeatureMatrixBuilder.build
+        :return: scores (1D array, one per window), stats dict with model throughput and latency
+        """
+        features = np.ascontiguousarray(features, dtype=float)
+        self.check_features(features.shape[1])
+        scores = np.empty(len(features))
+        batch_latencies = []
+
+        start = time.perf_counter()
+        for i in range(0, len(features), self.batch_size):
+            batch_start = time.perf_counter()
+            scores[i:i + self.batch_size] = self._predict(features[i:i + self.batch_size])
+            batch_latencies.append(time.perf_counter() - batch_start)
+        elapsed = time.perf_counter() - start
+
+        stats = {
+            "Windows": len(features),
+            "Model time (s)": elapsed,
+            "Model throughput (windows/s)": len(features) / elapsed if elapsed > 0 else 0.0,
+            "Mean batch latency (ms)": 1000 * np.mean(batch_latencies) if batch_latencies else 0.0,
+            "Max batch latency (ms)": 1000 * np.max(batch_latencies) if batch_latencies else 0.0
+        }
+        return scores, stats
+
+    @staticmethod
+    def summarize(scores, row_channels):
+        """
+        Aggregate window scores into per-channel and per-recording risk.
+
+        :param scores: 1D array of window scores
+        :param row_channels: Channel name of each window
+        :return: pandas DataFrame with mean score per channel, plus an "All" row for the recording
+        """
+        summary = pd.DataFrame({"Channel": row_channels, "Risk Score": scores})
+        per_channel = summary.groupby("Channel", sort=False)["Risk Score"].mean()
+        per_channel["All"] = summary["Risk Score"].mean()
+        return per_channel.to_frame()
@@ -0,0 +1,273 @@
+# components/surrogate_tester.py
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from components.complexity_analyzer import ComplexityAnalyzer
+from components.entropy_analyzer import EntropyAnalyzer
+
+
+class SurrogateTester:
+    """
+    Surrogate-data significance testing for EEG entropy and complexity metrics.
+    Builds a null distribution from phase-randomized or IAAFT surrogates, which keep the
+    power spectrum (and, for IAAFT, the amplitude distribution) but destroy nonlinear structure.
+    Reduced entropy in schizophrenia is only meaningful when it differs from this null.
+
+    Band power is deliberately not offered: these surrogates preserve the power spectrum
+    by construction, so band-power p-values would only reflect surrogate artifacts.
+    """
+
+    METHODS = ("phase", "iaaft")
+
+    # Metric names produced by each metric set, in output order
+    METRIC_SETS = {
+        "entropy": ["Sample Entropy", "Approximate Entropy", "Permutation Entropy"],
+        "complexity": ["Sample Entropy", "Higuchi FD", "Permutation Entropy"]
+    }
+
+    # Worker processes shared by every test in the server process
+    MAX_JOBS = max(1, min(4, os.cpu_count() or 1))
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, data, channels, sampling_rate=256, window_size_sec=5, n_surrogates=200,
+                 method="iaaft", metrics=("entropy",), n_jobs=None, seed=None):
+        """
+        Initialize with a multichannel recording.
+
+        :param data: 2D array (channels x samples), e.g. from EEGDataLoader.get_channel_array
+        :param channels: Channel names matching the rows of data
+        :param sampling_rate: Sampling frequency in Hz (default 256 Hz)
+        :param window_size_sec: Window length in seconds (default 5 s)
+        :param n_surrogates: Number of surrogates per window (default 200)
+        :param method: "phase" (phase randomization) or "iaaft" (default)
+        :param metrics: Metric sets to test, keys of METRIC_SETS (default: entropy)
+        :param n_jobs: Number of surrogate chunks run in parallel (default and maximum: MAX_JOBS)
+        :param seed: Random seed for reproducible surrogates
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown surrogate method '{method}'. Use one of {self.METHODS}.")
+        if n_surrogates < 1:
+            raise ValueError("At least one surrogate is required.")
+        unknown = [m for m in metrics if m not in self.METRIC_SETS]
+        if unknown:
+            raise ValueError(f"Unknown metric set(s) {unknown}. Use {list(self.METRIC_SETS)}.")
+
+        self.data = np.ascontiguousarray(data, dtype=float)
+        self.channels = list(channels)
+        self.sampling_rate = sampling_rate
+        self.window_size = int(window_size_sec * sampling_rate)
+        self.n_surrogates = n_surrogates
+        self.method = method
+        self.metrics = list(metrics)
+        self.n_jobs = min(n_jobs or self.MAX_JOBS, self.MAX_JOBS)
+        self.seed = seed
+
+    @staticmethod
+    def phase_randomize(signals, n_surrogates, rng):
+        """
+        Phase-randomized surrogates for a batch of signals, in one vectorized FFT.
+
+        :param signals: 2D array (n_signals x n_samples)
+        :param n_surrogates: Number of surrogates per signal
+        :param rng: numpy Generator
+        :return: 3D array (n_surrogates x n_signals x n_samples)
+        """
+        n_samples = signals.shape[-1]
+        spectrum = np.fft.rfft(signals, axis=-1)
+
+        phases = rng.uniform(0, 2 * np.pi, (n_surrogates,) + spectrum.shape)
+        # DC (and Nyquist for even lengths) must stay real
+        phases[..., 0] = 0
+        if n_samples % 2 == 0:
+            phases[..., -1] = 0
+
+        return np.fft.irfft(spectrum * np.exp(1j * phases), n=n_samples, axis=-1)
+
+    @staticmethod
+    def iaaft(signals, n_surrogates, rng, iterations=10):
+        """
+        Iterative amplitude-adjusted Fourier transform surrogates for a batch of signals.
+        All surrogates are refined together, one batched FFT pair per iteration.
+
+        :param signals: 2D array (n_signals x n_samples)
+        :param n_surrogates: Number of surrogates per signal
+        :param rng: numpy Generator
+        :param iterations: Number of spectrum/amplitude adjustment iterations (default 10)
+        :return: 3D array (n_surrogates x n_signals x n_samples)
+        """
+        n_samples = signals.shape[-1]
+        amplitudes = np.abs(np.fft.rfft(signals, axis=-1))
+
+        surrogates = np.repeat(signals[np.newaxis], n_surrogates, axis=0)
+        sorted_values = np.broadcast_to(np.sort(signals, axis=-1), surrogates.shape)
+
+        # Start from random shuffles of each signal
+        rng.permuted(surrogates, axis=-1, out=surrogates)
+
+        for _ in range(iterations):
+            # Impose the original power spectrum, keeping the current phases
+            spectrum = np.fft.rfft(surrogates, axis=-1)
+            spectrum *= amplitudes / np.maximum(np.abs(spectrum), 1e-12)
+            surrogates = np.fft.irfft(spectrum, n=n_samples, axis=-1)
+
+            # Impose the original amplitude distribution by rank ordering
+            ranks = np.argsort(np.argsort(surrogates, axis=-1), axis=-1)
+            surrogates = np.take_along_axis(sorted_values, ranks, axis=-1)
+
+        return surrogates
+
+    @classmethod
+    def get_executor(cls):
+        """
+        Return the process pool shared by all tests, creating it on first use.
+
+        Workers are spawned rather than forked, since forking the multithreaded
+        Streamlit server can deadlock on locks held by other threads.
+        """
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ProcessPoolExecutor(max_workers=cls.MAX_JOBS,
+                                                    mp_context=multiprocessing.get_context("spawn"))
+            return cls._executor
+
+    def get_windows(self):
+        """
+        Split every channel into non-overlapping windows.
+
+        :return: 2D array (n_channels * n_windows x window_size), channel-major
+        """
+        num_windows = self.data.shape[1] // self.window_size
+        usable = self.data[:, :num_windows * self.window_size]
+        return usable.reshape(-1, self.window_size)
+
+    def get_metric_names(self):
+        """
+        Return (metric set, metric name) pairs in the column order of the computed metrics.
+        """
+        return [(metric_set, name) for metric_set in self.metrics for name in self.METRIC_SETS[metric_set]]
+
+    def run(self, tail="less"):
+        """
+        Compute observed metrics, their surrogate null distributions and p-values.
+
+        :param tail: "less" (metric reduced vs. surrogates, default), "greater" or "two-sided"
+        :return: pandas DataFrame with one row per channel, window and metric
+        """
+        windows = self.get_windows()
+        num_windows = len(windows) // max(len(self.channels), 1)
+        if len(windows) == 0:
+            return pd.DataFrame(columns=["Channel", "Window", "Metric Set", "Metric",
+                                         "Observed", "Surrogate Mean", "p-value"])
+
+        # Split the surrogates into one chunk per worker, each with an independent seed
+        n_chunks = min(self.n_jobs, self.n_surrogates)
+        chunk_sizes = [len(c) for c in np.array_split(np.arange(self.n_surrogates), n_chunks)]
+        seeds = np.random.SeedSequence(self.seed).spawn(n_chunks)
+        args = (self.method, self.metrics, self.sampling_rate)
+
+        if self.n_jobs > 1:
+            executor = self.get_executor()
+            observed_future = executor.submit(_evaluate_metrics, windows, self.metrics, self.sampling_rate)
+            surrogate_futures = [executor.submit(_surrogate_metrics, windows, size, seed, *args)
+                                 for size, seed in zip(chunk_sizes, seeds)]
+            observed = observed_future.result()
+            surrogate_values = np.concatenate([f.result() for f in surrogate_futures])
+        else:
+            observed = _evaluate_metrics(windows, self.metrics, self.sampling_rate)
+            surrogate_values = np.concatenate([_surrogate_metrics(windows, size, seed, *args)
+                                               for size, seed in zip(chunk_sizes, seeds)])
+
+        p_values = self.p_values(observed, surrogate_values, tail)
+
+        metric_names = self.get_metric_names()
+        n_metrics = len(metric_names)
+        return pd.DataFrame({
+            "Channel": np.repeat(self.channels, num_windows * n_metrics),
+            "Window": np.tile(np.repeat(np.arange(num_windows), n_metrics), len(self.channels)),
+            "Metric Set": [metric_set for metric_set, _ in metric_names] * len(windows),
+            "Metric": [name for _, name in metric_names] * len(windows),
+            "Observed": observed.ravel(),
+            "Surrogate Mean": np.nanmean(surrogate_values, axis=0).ravel(),
+            "p-value": p_values.ravel()
+        })
+
+    @staticmethod
+    def p_values(observed, surrogate_values, tail="less"):
+        """
+        Rank-based p-values of observed metrics against their surrogate distributions.
+
+        :param observed: Array of observed metrics (n_windows x n_metrics)
+        :param surrogate_values: Array of surrogate metrics (n_surrogates x n_windows x n_metrics)
+        :param tail: "less", "greater" or "two-sided"
+        :return: Array of p-values with the shape of observed (NaN where observed is NaN)
+        """
+        valid = np.isfinite(surrogate_values)
+        n_valid = valid.sum(axis=0)
+        as_low = np.sum(valid & (surrogate_values <= observed), axis=0)
+        as_high = np.sum(valid & (surrogate_values >= observed), axis=0)
+
+        if tail == "less":
+            p = (1 + as_low) / (1 + n_valid)
+        elif tail == "greater":
+            p = (1 + as_high) / (1 + n_valid)
+        elif tail == "two-sided":
+            p = np.minimum(1.0, 2 * (1 + np.minimum(as_low, as_high)) / (1 + n_valid))
+        else:
+            raise ValueError(f"Unknown tail '{tail}'. Use 'less', 'greater' or 'two-sided'.")
+
+        return np.where(np.isfinite(observed), p, np.nan)
+
+
+def _metric_value(value):
+    """
+    neurokit2 returns (value, info) tuples; keep the value.
+    """
+    return value[0] if isinstance(value, tuple) else value
+
+
+def _evaluate_metrics(signals, metrics, sampling_rate):
+    """
+    Compute the requested metric sets for a batch of signals.
+    Module-level so it can run in worker processes.
+
+    :param signals: 2D array (n_signals x n_samples)
+    :param metrics: Metric set names
+    :param sampling_rate: Sampling frequency in Hz
+    :return: 2D array (n_signals x n_metric_values)
+    """
+    columns = []
+    for metric_set in metrics:
+        names = SurrogateTester.METRIC_SETS[metric_set]
+        if metric_set == "entropy":
+            values = [EntropyAnalyzer._compute_entropies(s) for s in signals]
+            columns.append(np.array([[v[name] for name in names] for v in values], dtype=float))
+        elif metric_set == "complexity":
+            values = [ComplexityAnalyzer(s, sampling_rate).calculate_complexity()[1] for s in signals]
+            columns.append(np.array([[_metric_value(v[name]) for name in names] for v in values], dtype=float))
+
+    return np.hstack(columns).reshape(len(signals), -1)
+
+
+def _surrogate_metrics(windows, n_surrogates, seed, method, metrics, sampling_rate):
+    """
+    Generate one chunk of surrogates for all windows and compute their metrics.
+    Module-level so it can run in worker processes.
+
+    :return: 3D array (n_surrogates x n_windows x n_metric_values)
+    """
+    rng = np.random.default_rng(seed)
+    if method == "phase":
+        surrogates = SurrogateTester.phase_randomize(windows, n_surrogates, rng)
+    else:
+        surrogates = SurrogateTester.iaaft(windows, n_surrogates, rng)
+
+    values = _evaluate_metrics(surrogates.reshape(-1, windows.shape[-1]), metrics, sampling_rate)
+    return values.reshape(n_surrogates, len(windows), -1)
@@ -1,8 +1,11 @@
 # components/visualizer.py
 
+import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
+from components.figure_renderer import FigureRenderer
+
 
 class EEGVisualizer:
     """
@@ -18,7 +21,7 @@ class EEGVisualizer:
         """
         self.data = data
         self.sampling_rate = sampling_rate
-        self.time = [i / sampling_rate for i in range(len(data))]
+        self.time = np.arange(len(data)) / sampling_rate
 
     def plot_channels(self, channels=None, time_range=(0, 5)):
         """
@@ -38,27 +41,37 @@ class EEGVisualizer:
             start_idx = max(0, min(start_idx, len(self.data)))
             end_idx = len(self.data)
 
-        fig = go.Figure()
+        channels = [ch for ch in channels if ch in self.data.columns]
+        if not channels:
+            st.error("No schizophrenia-relevant channels available in the data.")
+            return
 
-        for ch in channels:
-            if ch in self.data.columns:
+        segment = self.data[channels].iloc[start_idx:end_idx].to_numpy(dtype=float)
+        key = FigureRenderer.data_key(segment, plot="channels", channels=tuple(channels),
+                                      start_idx=start_idx, sampling_rate=self.sampling_rate)
+
+        def build():
+            fig = go.Figure()
+            for ch, values in zip(channels, segment.T):
+                # Uniform time axis is sent as x0/dx instead of a per-sample array
+                y, step = FigureRenderer.compact_trace(values)
                 fig.add_trace(go.Scatter(
-                    x=self.time[start_idx:end_idx],
-                    y=self.data[ch].iloc[start_idx:end_idx],
+                    x0=start_idx / self.sampling_rate,
+                    dx=step / self.sampling_rate,
+                    y=y,
                     mode='lines',
                     name=ch
                 ))
 
-        if fig.data:
             fig.update_layout(
                 title="EEG Channels - Schizophrenia Relevant",
                 xaxis_title="Time (s)",
                 yaxis_title="Amplitude (µV)",
                 legend_title="Electrode"
             )
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.error("No schizophrenia-relevant channels available in the data.")
+            return fig
+
+        FigureRenderer.plotly_chart(key, build, use_container_width=True)
 
     @staticmethod
     def plot_entropy_over_time(entropy_windows_ch1, entropy_windows_ch2, window_size_sec):
@@ -73,38 +86,33 @@ class EEGVisualizer:
             st.warning("Entropy data is empty. Cannot plot.")
             return
 
-        times = [i * window_size_sec for i in range(len(entropy_windows_ch1))]
-
-        fig = go.Figure()
         colors = {"Sample Entropy": "blue", "Approximate Entropy": "green", "Permutation Entropy": "red"}
+        values_ch1 = np.array([[window.get(metric) for metric in colors] for window in entropy_windows_ch1], dtype=float)
+        values_ch2 = np.array([[window.get(metric) for metric in colors] for window in entropy_windows_ch2], dtype=float)
+        key = FigureRenderer.data_key(values_ch1, values_ch2, plot="entropy_over_time",
+                                      window_size_sec=window_size_sec)
+
+        def build():
+            fig = go.Figure()
+            for label, symbol, values in (("Ch1", "circle", values_ch1), ("Ch2", "triangle-up", values_ch2)):
+                for (metric, color), column in zip(colors.items(), values.T):
+                    fig.add_trace(go.Scatter(
+                        x0=0, dx=window_size_sec, y=FigureRenderer.compact_values(column),
+                        mode='lines+markers',
+                        marker=dict(symbol=symbol, size=8, color=color),
+                        line=dict(width=1),
+                        name=f"{label} - {metric}"
+                    ))
 
-        # Channel 1
-        for metric, color in colors.items():
-            values = [window.get(metric, None) for window in entropy_windows_ch1]
-            fig.add_trace(go.Scatter(
-                x=times, y=values, mode='lines+markers',
-                marker=dict(symbol="circle", size=8, color=color),
-                line=dict(width=1),
-                name=f"Ch1 - {metric}"
-            ))
-
-        # Channel 2
-        for metric, color in colors.items():
-            values = [window.get(metric, None) for window in entropy_windows_ch2]
-            fig.add_trace(go.Scatter(
-                x=times, y=values, mode='lines+markers',
-                marker=dict(symbol="triangle-up", size=8, color=color),
-                line=dict(width=1),
-                name=f"Ch2 - {metric}"
-            ))
-
-        fig.update_layout(
-            title="Entropy Over Time - Schizophrenia EEG",
-            xaxis_title="Time (s)",
-            yaxis_title="Entropy Value",
-            legend_title="Metrics"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+            fig.update_layout(
+                title="Entropy Over Time - Schizophrenia EEG",
+                xaxis_title="Time (s)",
+                yaxis_title="Entropy Value",
+                legend_title="Metrics"
+            )
+            return fig
+
+        FigureRenderer.plotly_chart(key, build, use_container_width=True)
 
     @staticmethod
     def plot_average_entropy_bars(entropy_ch1, entropy_ch2, labels):
@@ -119,15 +127,90 @@ class EEGVisualizer:
             st.warning("Entropy data is empty. Cannot plot bars.")
             return
 
-        fig = go.Figure()
+        key = FigureRenderer.data_key(np.asarray(entropy_ch1, dtype=float), np.asarray(entropy_ch2, dtype=float),
+                                      plot="average_entropy_bars", labels=tuple(labels))
+
+        def build():
+            fig = go.Figure()
+            fig.add_trace(go.Bar(x=labels, y=FigureRenderer.compact_values(entropy_ch1),
+                                 name="Channel 1", marker_color='orange'))
+            fig.add_trace(go.Bar(x=labels, y=FigureRenderer.compact_values(entropy_ch2),
+                                 name="Channel 2", marker_color='purple'))
+
+            fig.update_layout(
+                title="Average Entropy Comparison",
+                xaxis_title="Entropy Metric",
+                yaxis_title="Value",
+                barmode="group"
+            )
+            return fig
+
+        FigureRenderer.plotly_chart(key, build)
+
+    @staticmethod
+    def plot_erp(erp, times, channels, title="Event-Related Potential"):
+        """
+        Plots averaged ERP waveforms for several channels.
+
+        :param erp: 2D array (channels x samples) from EpochAnalyzer.compute_erp
+        :param times: 1D array of epoch times in seconds (relative to the event)
+        :param channels: Channel names matching the rows of erp
+        :param title: Figure title
+        """
+        if erp.size == 0:
+            st.warning("ERP data is empty. Cannot plot.")
+            return
+
+        key = FigureRenderer.data_key(erp, times, plot="erp", channels=tuple(channels), title=title)
+
+        def build():
+            fig = go.Figure()
+            for ch, waveform in zip(channels, erp):
+                y, step = FigureRenderer.compact_trace(waveform)
+                fig.add_trace(go.Scatter(x0=times[0], dx=step * (times[1] - times[0]), y=y, mode='lines', name=ch))
+
+            fig.add_vline(x=0, line_dash="dash", line_color="gray")
+            fig.update_layout(
+                title=title,
+                xaxis_title="Time relative to stimulus (s)",
+                yaxis_title="Amplitude (µV)",
+                legend_title="Electrode"
+            )
+            return fig
 
-        fig.add_trace(go.Bar(x=labels, y=entropy_ch1, name="Channel 1", marker_color='orange'))
-        fig.add_trace(go.Bar(x=labels, y=entropy_ch2, name="Channel 2", marker_color='purple'))
+        FigureRenderer.plotly_chart(key, build, use_container_width=True)
+
+    @staticmethod
+    def plot_ersp(ersp, frequencies, times, channel):
+        """
+        Plots the event-related spectral perturbation of one channel as a heatmap.
+
+        :param ersp: 2D array (frequencies x samples) for the channel
+        :param frequencies: 1D array of frequencies
+        :param times: 1D array of epoch times in seconds (relative to the event)
+        :param channel: Channel name
+        """
+        if ersp.size == 0 or len(frequencies) == 0:
+            st.warning("ERSP data is empty. Cannot plot.")
+            return
+
+        key = FigureRenderer.data_key(ersp, frequencies, times, plot="ersp", channel=channel)
+
+        def build():
+            z, step = FigureRenderer.compact_grid(ersp)
+            fig = go.Figure(data=[go.Heatmap(
+                z=z,
+                x0=times[0],
+                dx=step * (times[1] - times[0]),
+                y=FigureRenderer.compact_values(frequencies),
+                colorscale='RdBu_r',
+                zmid=0
+            )])
+            fig.update_layout(
+                title=f"ERSP - {channel}",
+                xaxis_title="Time relative to stimulus (s)",
+                yaxis_title="Frequency (Hz)"
+            )
+            return fig
 
-        fig.update_layout(
-            title="Average Entropy Comparison",
-            xaxis_title="Entropy Metric",
-            yaxis_title="Value",
-            barmode="group"
-        )
-        st.plotly_chart(fig)
+        FigureRenderer.plotly_chart(key, build, use_container_width=True)
@@ -5,6 +5,8 @@ import plotly.graph_objects as go
 import streamlit as st
 import pywt
 
+from components.figure_renderer import FigureRenderer
+
 
 class WaveletAnalyzer:
     """
@@ -12,6 +14,17 @@ class WaveletAnalyzer:
     Focuses on delta, theta, alpha, beta, and gamma bands.
     """
 
+    WAVELET = 'cmor1.5-1.0'
+
+    # Standard EEG bands {name: (low, high)} in Hz
+    BANDS = {
+        "Delta": (0.5, 4),
+        "Theta": (4, 8),
+        "Alpha": (8, 12),
+        "Beta": (12, 30),
+        "Gamma": (30, 50)
+    }
+
     def __init__(self, signal, sampling_rate=256, min_freq=0.5, max_freq=50):
         """
         Initialize with EEG signal.
@@ -44,16 +57,35 @@ class WaveletAnalyzer:
         signal_slice = self.signal[start_idx:end_idx]
 
         # CWT using Morlet wavelet
-        coefficients, _ = pywt.cwt(signal_slice, self.scales, 'cmor1.5-1.0')
+        coefficients, _ = pywt.cwt(signal_slice, self.scales, self.WAVELET)
 
         # Convert scales to frequencies
-        frequencies = pywt.scale2frequency('cmor1.5-1.0', self.scales) * self.sampling_rate
+        frequencies = pywt.scale2frequency(self.WAVELET, self.scales) * self.sampling_rate
         mask = (frequencies >= self.min_freq) & (frequencies <= self.max_freq)
         frequencies = frequencies[mask]
         coefficients = coefficients[mask, :]
 
         return coefficients, frequencies
 
+    def perform_batch_transform(self):
+        """
+        Perform the CWT on every signal of a stacked array in a single call.
+
+        The signal passed to the constructor may be an N-D array (e.g. an
+        events x channels x samples epoch tensor); the transform runs along the
+        last axis for all leading dimensions at once, using FFT convolution.
+
+        :return: coefficients (n_freqs x ...signal shape), corresponding frequencies (1D array)
+        """
+        frequencies = pywt.scale2frequency(self.WAVELET, self.scales) * self.sampling_rate
+        mask = (frequencies >= self.min_freq) & (frequencies <= self.max_freq)
+
+        # Only transform the scales that survive the frequency mask
+        coefficients, _ = pywt.cwt(np.asarray(self.signal), self.scales[mask], self.WAVELET,
+                                   method='fft', axis=-1)
+
+        return coefficients, frequencies[mask]
+
     @staticmethod
     def plot_wavelet_transform(coefficients, frequencies, time_range=(0, 5)):
         """
@@ -67,25 +99,32 @@ class WaveletAnalyzer:
             st.warning("No coefficients to plot.")
             return
 
-        time = np.linspace(time_range[0], time_range[1], num=coefficients.shape[1])
+        key = FigureRenderer.data_key(coefficients, frequencies, plot="wavelet", time_range=tuple(time_range))
+
+        def build():
+            magnitude = np.abs(coefficients)
+            z, step = FigureRenderer.compact_grid(magnitude)
+            dt = (time_range[1] - time_range[0]) / max(coefficients.shape[1] - 1, 1)
+
+            heatmap = go.Heatmap(
+                z=z,
+                x0=time_range[0],
+                dx=step * dt,
+                y=FigureRenderer.compact_values(frequencies),
+                colorscale='Viridis',
+                zmin=0,
+                zmax=np.max(magnitude)
+            )
 
-        heatmap = go.Heatmap(
-            z=np.abs(coefficients),
-            x=time,
-            y=frequencies,
-            colorscale='Viridis',
-            zmin=0,
-            zmax=np.max(np.abs(coefficients))
-        )
+            layout = go.Layout(
+                title=f"EEG Time-Frequency (Wavelet) from {time_range[0]}s to {time_range[1]}s",
+                xaxis_title="Time (s)",
+                yaxis_title="Frequency (Hz)"
+            )
 
-        layout = go.Layout(
-            title=f"EEG Time-Frequency (Wavelet) from {time_range[0]}s to {time_range[1]}s",
-            xaxis_title="Time (s)",
-            yaxis_title="Frequency (Hz)"
-        )
+            return go.Figure(data=[heatmap], layout=layout)
 
-        fig = go.Figure(data=[heatmap], layout=layout)
-        st.plotly_chart(fig, use_container_width=True)
+        FigureRenderer.plotly_chart(key, build, use_container_width=True)
 
     @staticmethod
     def extract_band_power(coefficients, frequencies, bands=None):
@@ -98,13 +137,7 @@ class WaveletAnalyzer:
         :return: dict of band powers
         """
         if bands is None:
-            bands = {
-                "Delta": (0.5, 4),
-                "Theta": (4, 8),
-                "Alpha": (8, 12),
-                "Beta": (12, 30),
-                "Gamma": (30, 50)
-            }
+            bands = WaveletAnalyzer.BANDS
 
         band_power = {}
         for band, (low, high) in bands.items():
@@ -114,3 +147,25 @@ class WaveletAnalyzer:
             else:
                 band_power[band] = 0
         return band_power
+
+    @staticmethod
+    def extract_band_power_batch(coefficients, frequencies, bands=None):
+        """
+        Compute average band power for a batch of signals at once.
+
+        :param coefficients: CWT coefficients (n_freqs x n_signals x n_samples), e.g. from perform_batch_transform
+        :param frequencies: 1D frequency array
+        :param bands: dict of EEG bands {name: (low, high)}
+        :return: 2D array (n_signals x n_bands) of band powers, in the order of bands
+        """
+        if bands is None:
+            bands = WaveletAnalyzer.BANDS
+
+        # Mean power per frequency and signal, then averaged within each band
+        power = np.mean(np.abs(coefficients) ** 2, axis=-1)
+        band_power = np.zeros((power.shape[1], len(bands)))
+        for i, (low, high) in enumerate(bands.values()):
+            mask = (frequencies >= low) & (frequencies <= high)
+            if np.any(mask):
+                band_power[:, i] = power[mask].mean(axis=0)
+        return band_power
@@ -1,8 +1,10 @@
 # pages/1_⚡_EEG_Visualization.py
 
 from components.data_loader import EEGDataLoader
+from components.preprocessing import PreprocessingPipeline
 from components.visualizer import EEGVisualizer
 from components.ui_elements import UIElements
+import pandas as pd
 import streamlit as st
 import os
 
@@ -33,8 +35,30 @@ def main():
         st.markdown("**Relevant electrodes:** F3, F4, F7, F8, T3, T4, Cz, Pz")
         st.markdown("**Reference electrode:** Mastoid or behind the ear")
 
+        # Optional preprocessing, evaluated in one fused pass and cached per configuration
+        st.sidebar.header("Preprocessing")
+        pipeline = PreprocessingPipeline(sampling_rate=256)
+        # Averaged over every electrode in the file, not only the displayed channels
+        if st.sidebar.checkbox("Common-average reference"):
+            pipeline.rereference("average")
+        line_freq = st.sidebar.selectbox("Notch filter", ["Off", "50 Hz", "60 Hz"])
+        if line_freq != "Off":
+            pipeline.notch(int(line_freq.split()[0]))
+        if st.sidebar.checkbox("Bandpass filter"):
+            low_freq, high_freq = st.sidebar.slider("Passband (Hz)", 0.5, 100.0, (1.0, 50.0), 0.5)
+            try:
+                pipeline.bandpass(low_freq, high_freq)
+            except ValueError as e:
+                st.error(str(e))
+                return
+        pipeline.decimate(st.sidebar.selectbox("Decimation factor", [1, 2, 4]))
+
+        if not pipeline.is_identity():
+            processed, processed_channels = pipeline.run(eeg_loader)
+            data = pd.DataFrame(processed.T, columns=processed_channels)
+
         # Instantiate the visualizer
-        visualizer = EEGVisualizer(data, sampling_rate=256)
+        visualizer = EEGVisualizer(data, sampling_rate=pipeline.output_rate)
 
         # Select time range
         total_duration = len(data) / visualizer.sampling_rate
@@ -1,5 +1,6 @@
 # pages/2_📡_Frequency_Analysis.py
 
+from components.compute_service import ComputeService
 from components.data_loader import EEGDataLoader
 from components.wavelet_analyzer import WaveletAnalyzer
 from components.visualizer import EEGVisualizer
@@ -53,9 +54,11 @@ def main():
             )
             visualizer.plot_channels([channel], time_range)
 
-            # Perform wavelet analysis
+            # Perform wavelet analysis (identical concurrent requests run only once)
             wavelet_analyzer = WaveletAnalyzer(signal, sampling_rate)
-            coefficients, frequencies = wavelet_analyzer.perform_wavelet_transform(time_range)
+            service = ComputeService.instance()
+            key = ("wavelet", service.file_key(eeg_loader.file_path), channel, sampling_rate, tuple(time_range))
+            coefficients, frequencies = service.run(key, wavelet_analyzer.perform_wavelet_transform, time_range)
 
             # Plot wavelet transform heatmap
             wavelet_analyzer.plot_wavelet_transform(coefficients, frequencies, time_range)
@@ -3,8 +3,10 @@
 import streamlit as st
 import os
 import numpy as np
-import matplotlib.pyplot as plt
+from components.compute_service import ComputeService
 from components.data_loader import EEGDataLoader
+from components.figure_renderer import FigureRenderer
+from components.surrogate_tester import SurrogateTester
 from components.ui_elements import UIElements
 
 # --- ENTROPY FUNCTIONS ---
@@ -72,7 +74,10 @@ def main():
     signal = signal[int(start*sampling_rate):int(end*sampling_rate)]
 
     window_size = st.number_input("Window size (s)", min_value=5, max_value=30, value=5, step=5)
-    entropies = calculate_entropies_in_windows(signal, sampling_rate, window_size_sec=window_size)
+    service = ComputeService.instance()
+    key = ("entropy_windows", service.file_key(eeg_loader.file_path), selected_channel,
+           sampling_rate, start, end, window_size)
+    entropies = service.run(key, calculate_entropies_in_windows, signal, sampling_rate, window_size_sec=window_size)
     if not entropies:
         st.warning("No entropy calculated. Adjust window size or signal length.")
         return
@@ -86,23 +91,57 @@ def main():
     st.text(table_text)
 
     # --- PLOT ENTROPIES ---
-    fig, ax = plt.subplots(figsize=(10,4))
+    metrics = ["Shannon","Approximate","Sample"]
+    values = np.array([[w[metric] for metric in metrics] for w in entropies])
     time_points = np.arange(len(entropies)) * window_size
-    for metric in ["Shannon","Approximate","Sample"]:
-        ax.plot(time_points, [w[metric] for w in entropies], label=metric)
-    ax.set_xlabel("Time (s)")
-    ax.set_ylabel("Entropy")
-    ax.set_title(f"Entropy over time - {selected_channel}")
-    ax.legend()
-    st.pyplot(fig)
+
+    def draw_entropies(ax):
+        for metric, column in zip(metrics, values.T):
+            ax.plot(time_points, column, label=metric)
+        ax.set_xlabel("Time (s)")
+        ax.set_ylabel("Entropy")
+        ax.set_title(f"Entropy over time - {selected_channel}")
+        ax.legend()
+
+    FigureRenderer.pyplot(
+        FigureRenderer.data_key(values, plot="entropy_lines", channel=selected_channel, window_size=window_size),
+        draw_entropies, figsize=(10,4)
+    )
 
     # --- AVERAGE ENTROPY BAR ---
-    avg_entropy = {metric: np.mean([w[metric] for w in entropies]) for metric in ["Shannon","Approximate","Sample"]}
-    fig2, ax2 = plt.subplots(figsize=(6,4))
-    ax2.bar(avg_entropy.keys(), avg_entropy.values(), color=["#1f77b4","#ff7f0e","#2ca02c"])
-    ax2.set_ylabel("Average Entropy")
-    ax2.set_title(f"Average Entropy - {selected_channel}")
-    st.pyplot(fig2)
+    avg_entropy = values.mean(axis=0)
+
+    def draw_average(ax):
+        ax.bar(metrics, avg_entropy, color=["#1f77b4","#ff7f0e","#2ca02c"])
+        ax.set_ylabel("Average Entropy")
+        ax.set_title(f"Average Entropy - {selected_channel}")
+
+    FigureRenderer.pyplot(
+        FigureRenderer.data_key(avg_entropy, plot="entropy_bars", channel=selected_channel),
+        draw_average, figsize=(6,4)
+    )
+
+    # --- SURROGATE SIGNIFICANCE ---
+    with st.expander("Surrogate significance test (neurokit2 entropies)"):
+        method = st.selectbox("Surrogate method", ["iaaft", "phase"])
+        preserved = ("the same power spectrum and amplitude distribution" if method == "iaaft"
+                     else "the same power spectrum")
+        st.markdown("Tests whether the **neurokit2** Sample, Approximate and Permutation Entropy "
+                    f"of each window are **lower than expected** for a linear signal with {preserved}.  \n"
+                    "These are not the simplified Shannon/Approximate/Sample values shown above, "
+                    "so the observed values differ from that table.")
+        n_surrogates = st.number_input("Number of surrogates", min_value=19, max_value=1000, value=99, step=10)
+        if st.button("Run surrogate test"):
+            tester = SurrogateTester(np.asarray(signal, dtype=float)[np.newaxis], [selected_channel],
+                                     sampling_rate, window_size, n_surrogates, method)
+            # Runs on the service's long-job lane: bounded and shared, without blocking page loads
+            key = ("surrogates", service.file_key(eeg_loader.file_path), selected_channel,
+                   sampling_rate, start, end, window_size, n_surrogates, method)
+            with st.spinner("Computing surrogate null distributions..."):
+                results = service.run(key, tester.run, lane="long")
+            results = results.assign(Metric="neurokit2 " + results["Metric"])
+            # Show as plain text table to avoid PyArrow
+            st.text(results.to_string(index=False))
 
 
 if __name__ == "__main__":
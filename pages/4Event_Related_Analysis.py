@@ -0,0 +1,84 @@
+# pages/4_🎯_Event_Related_Analysis.py
+
+from components.data_loader import EEGDataLoader
+from components.epoch_analyzer import EpochAnalyzer
+from components.visualizer import EEGVisualizer
+from components.ui_elements import UIElements
+import numpy as np
+import streamlit as st
+import os
+
+# Columns that may hold stimulus markers (non-zero sample = event code)
+MARKER_COLUMNS = ["Marker", "Event", "Stim", "Trigger"]
+
+
+def main():
+    st.set_page_config(page_title="Schizophrenia EEG Event-Related Analysis", page_icon="🎯")
+
+    UIElements.display_usach_logo()
+
+    st.title("Event-Related Analysis (ERP / ERSP)")
+
+    # List available CSV files
+    available_files = [f for f in os.listdir("data") if f.endswith(".csv")]
+    if not available_files:
+        st.warning("No EEG CSV files found in the 'data' folder.")
+        return
+
+    selected_file = st.selectbox("Select an EEG file to load", available_files)
+
+    sampling_rate = 256  # Clinical EEG standard
+    eeg_loader = EEGDataLoader(selected_file, sampling_rate)
+    data = eeg_loader.load_data()
+    if data is None:
+        return
+
+    channels = eeg_loader.get_channels()
+    if not channels:
+        st.error("No schizophrenia-relevant channels found in the EEG data.")
+        return
+
+    # Stimulus markers: use a marker column if present, otherwise a fixed stimulus interval
+    marker_column = next((col for col in MARKER_COLUMNS if col in data.columns), None)
+    if marker_column:
+        codes = data[marker_column]
+        # Sparse marker columns read as NaN (numeric) or "" (text) between events
+        mask = codes.notna() & (codes != 0)
+        if codes.dtype == object:
+            mask &= codes.astype(str).str.strip() != ""
+        event_idx = np.flatnonzero(mask.to_numpy())
+        events = event_idx / sampling_rate
+        labels = codes.to_numpy()[event_idx]
+        st.markdown(f"**Events:** {len(events)} markers read from column `{marker_column}`")
+    else:
+        interval = st.number_input("No marker column found. Stimulus interval (s)",
+                                   min_value=0.5, max_value=10.0, value=1.0, step=0.1)
+        total_duration = len(data) / sampling_rate
+        events = np.arange(interval, total_duration, interval)
+        labels = None
+        st.markdown(f"**Events:** {len(events)} evenly spaced stimuli")
+
+    tmin, tmax = st.slider("Epoch window relative to stimulus (s)", -1.0, 2.0, (-0.2, 0.8), 0.05)
+    if tmin >= 0:
+        st.error("The epoch window must include a pre-stimulus baseline (start < 0).")
+        return
+
+    epoch_analyzer = EpochAnalyzer(eeg_loader.get_channel_array(channels), events,
+                                   sampling_rate, tmin, tmax, labels)
+
+    condition = None
+    if labels is not None:
+        conditions = sorted(set(epoch_analyzer.labels.tolist()), key=str)
+        selected = st.selectbox("Condition", ["All"] + conditions)
+        condition = None if selected == "All" else selected
+
+    erp = epoch_analyzer.compute_erp(condition)
+    EEGVisualizer.plot_erp(erp, epoch_analyzer.times, channels)
+
+    channel = st.selectbox("Select a channel for ERSP", channels)
+    ersp, frequencies = epoch_analyzer.compute_ersp(condition, picks=[channels.index(channel)])
+    EEGVisualizer.plot_ersp(ersp[0], frequencies, epoch_analyzer.times, channel)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# pages/5_🩺_Risk_Scoring.py
+
+from components.data_loader import EEGDataLoader
+from components.feature_extractor import FeatureMatrixBuilder
+from components.risk_scorer import RiskScorer
+from components.ui_elements import UIElements
+import pandas as pd
+import streamlit as st
+import os
+import time
+
+
+def main():
+    st.set_page_config(page_title="Schizophrenia EEG Risk Scoring", page_icon="🩺")
+
+    UIElements.display_usach_logo()
+
+    st.title("Window-Level Risk Scoring")
+
+    # Serialized classifiers are kept in the 'models' folder
+    available_models = [f for f in os.listdir("models") if f.endswith(".pkl")] if os.path.isdir("models") else []
+    if not available_models:
+        st.warning("No pickled models (.pkl) found in the 'models' folder.")
+        return
+
+    available_files = [f for f in os.listdir("data") if f.endswith(".csv")]
+    if not available_files:
+        st.warning("No EEG CSV files found in the 'data' folder.")
+        return
+
+    selected_model = st.selectbox("Select a model", available_models)
+    selected_files = st.multiselect("Select recordings to score", available_files, default=available_files)
+    window_size = st.number_input("Window size (s)", min_value=1, max_value=30, value=5, step=1)
+    include_entropy = st.checkbox("Include entropy features (slower)", value=True)
+
+    if not selected_files or not st.button("Score recordings"):
+        return
+
+    sampling_rate = 256  # Clinical EEG standard
+    scorer = RiskScorer(os.path.join("models", selected_model))
+
+    results = []
+    for file_name in selected_files:
+        eeg_loader = EEGDataLoader(file_name, sampling_rate)
+        if eeg_loader.load_data() is None:
+            continue
+
+        channels = eeg_loader.get_channels()
+        if not channels:
+            continue
+
+        # End-to-end timing covers feature building as well as the model calls
+        start = time.perf_counter()
+        builder = FeatureMatrixBuilder(eeg_loader.get_channel_array(channels), channels,
+                                       sampling_rate, window_size, include_entropy)
+        try:
+            scorer.check_features(len(builder.feature_names))
+        except ValueError as e:
+            st.error(str(e))
+            return
+
+        features, row_channels, _ = builder.build()
+        if len(features) == 0:
+            st.warning(f"'{file_name}' is shorter than one window. Skipped.")
+            continue
+
+        scores, stats = scorer.score(features)
+        elapsed = time.perf_counter() - start
+        stats["End-to-end time (s)"] = elapsed
+        stats["End-to-end throughput (windows/s)"] = len(features) / elapsed if elapsed > 0 else 0.0
+        summary = RiskScorer.summarize(scores, row_channels)
+
+        st.subheader(f"Risk scores - {file_name}")
+        # Show as plain text tables to avoid PyArrow
+        st.text(summary.to_string())
+        results.append({"Recording": file_name, "Risk Score": summary.loc["All", "Risk Score"], **stats})
+
+    if results:
+        st.subheader("Cohort summary")
+        st.text(pd.DataFrame(results).set_index("Recording").to_string())
+
+
+if __name__ == "__main__":
+    main()